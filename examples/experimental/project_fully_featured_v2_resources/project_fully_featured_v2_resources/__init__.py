@@ -2,17 +2,18 @@
 
 from dagster import Definitions
 
+from . import resources
 from .assets import activity_analytics_assets, core_assets, dbt_assets, recommender_assets
 from .jobs import activity_analytics_assets_sensor, core_assets_schedule, recommender_assets_sensor
-from .resources import RESOURCES_LOCAL, RESOURCES_PROD, RESOURCES_STAGING
 from .sensors import make_slack_on_failure_sensor
 
 all_assets = [*core_assets, *recommender_assets, *dbt_assets, *activity_analytics_assets]
 
+# resources are built on first access, so only the selected deployment's resources are constructed
 resources_by_deployment_name = {
-    "prod": RESOURCES_PROD,
-    "staging": RESOURCES_STAGING,
-    "local": RESOURCES_LOCAL,
+    "prod": lambda: resources.RESOURCES_PROD,
+    "staging": lambda: resources.RESOURCES_STAGING,
+    "local": lambda: resources.RESOURCES_LOCAL,
 }
 
 deployment_name = os.environ.get("DAGSTER_DEPLOYMENT", "local")
@@ -23,7 +24,7 @@
 
 defs = Definitions(
     assets=all_assets,
-    resources=resources_by_deployment_name[deployment_name],
+    resources=resources_by_deployment_name[deployment_name](),
     schedules=[core_assets_schedule],
     sensors=all_sensors,
 )
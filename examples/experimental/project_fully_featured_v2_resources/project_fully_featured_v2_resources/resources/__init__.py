@@ -27,23 +27,25 @@
 )
 
 
-configured_pyspark = pyspark_resource.configured(
-    {
-        "spark_conf": {
-            "spark.jars.packages": ",".join(
-                [
-                    "net.snowflake:snowflake-jdbc:3.8.0",
-                    "net.snowflake:spark-snowflake_2.12:2.8.2-spark_3.0",
-                    "com.amazonaws:aws-java-sdk:1.7.4,org.apache.hadoop:hadoop-aws:2.7.7",
-                ]
-            ),
-            "spark.hadoop.fs.s3.impl": "org.apache.hadoop.fs.s3native.NativeS3FileSystem",
-            "spark.hadoop.fs.s3.awsAccessKeyId": os.getenv("AWS_ACCESS_KEY_ID", ""),
-            "spark.hadoop.fs.s3.awsSecretAccessKey": os.getenv("AWS_SECRET_ACCESS_KEY", ""),
-            "spark.hadoop.fs.s3.buffer.dir": "/tmp",
+def _configured_pyspark():
+    return pyspark_resource.configured(
+        {
+            "spark_conf": {
+                "spark.jars.packages": ",".join(
+                    [
+                        "net.snowflake:snowflake-jdbc:3.8.0",
+                        "net.snowflake:spark-snowflake_2.12:2.8.2-spark_3.0",
+                        "com.amazonaws:aws-java-sdk:1.7.4,org.apache.hadoop:hadoop-aws:2.7.7",
+                    ]
+                ),
+                "spark.hadoop.fs.s3.impl": "org.apache.hadoop.fs.s3native.NativeS3FileSystem",
+                "spark.hadoop.fs.s3.awsAccessKeyId": os.getenv("AWS_ACCESS_KEY_ID", ""),
+                "spark.hadoop.fs.s3.awsSecretAccessKey": os.getenv("AWS_SECRET_ACCESS_KEY", ""),
+                "spark.hadoop.fs.s3.buffer.dir": "/tmp",
+            }
         }
-    }
-)
+    )
+
 
 SHARED_SNOWFLAKE_CONF = {
     "account": os.getenv("SNOWFLAKE_ACCOUNT", ""),
@@ -52,38 +54,64 @@
     "warehouse": "TINY_WAREHOUSE",
 }
 
-RESOURCES_PROD = {
-    "s3_bucket": "hackernews-elementl-prod",
-    "io_manager": common_bucket_s3_pickle_io_manager,
-    "s3": s3_resource,
-    "parquet_io_manager": s3_partitioned_parquet_io_manager,
-    "warehouse_io_manager": SnowflakeIOManager(dict(database="DEMO_DB", **SHARED_SNOWFLAKE_CONF)),
-    "pyspark": configured_pyspark,
-    "hn_client": HNAPISubsampleClient(subsample_rate=10),
-    "dbt": dbt_prod_resource,
-}
 
+def _resources_prod():
+    return {
+        "s3_bucket": "hackernews-elementl-prod",
+        "io_manager": common_bucket_s3_pickle_io_manager,
+        "s3": s3_resource,
+        "parquet_io_manager": s3_partitioned_parquet_io_manager,
+        "warehouse_io_manager": SnowflakeIOManager(
+            dict(database="DEMO_DB", **SHARED_SNOWFLAKE_CONF)
+        ),
+        "pyspark": _configured_pyspark(),
+        "hn_client": HNAPISubsampleClient(subsample_rate=10),
+        "dbt": dbt_prod_resource,
+    }
 
-RESOURCES_STAGING = {
-    "s3_bucket": "hackernews-elementl-dev",
-    "io_manager": common_bucket_s3_pickle_io_manager,
-    "s3": s3_resource,
-    "parquet_io_manager": s3_partitioned_parquet_io_manager,
-    "warehouse_io_manager": SnowflakeIOManager(
-        dict(database="DEMO_DB_STAGING", **SHARED_SNOWFLAKE_CONF)
-    ),
-    "pyspark": configured_pyspark,
-    "hn_client": HNAPISubsampleClient(subsample_rate=10),
-    "dbt": dbt_staging_resource,
-}
+
+def _resources_staging():
+    return {
+        "s3_bucket": "hackernews-elementl-dev",
+        "io_manager": common_bucket_s3_pickle_io_manager,
+        "s3": s3_resource,
+        "parquet_io_manager": s3_partitioned_parquet_io_manager,
+        "warehouse_io_manager": SnowflakeIOManager(
+            dict(database="DEMO_DB_STAGING", **SHARED_SNOWFLAKE_CONF)
+        ),
+        "pyspark": _configured_pyspark(),
+        "hn_client": HNAPISubsampleClient(subsample_rate=10),
+        "dbt": dbt_staging_resource,
+    }
+
+
+def _resources_local():
+    return {
+        "parquet_io_manager": local_partitioned_parquet_io_manager,
+        "warehouse_io_manager": duckdb_partitioned_parquet_io_manager.configured(
+            {"duckdb_path": os.path.join(DBT_PROJECT_DIR, "hackernews.duckdb")},
+        ),
+        "pyspark": _configured_pyspark(),
+        "hn_client": HNAPIClient(),
+        "dbt": dbt_local_resource,
+    }
 
 
-RESOURCES_LOCAL = {
-    "parquet_io_manager": local_partitioned_parquet_io_manager,
-    "warehouse_io_manager": duckdb_partitioned_parquet_io_manager.configured(
-        {"duckdb_path": os.path.join(DBT_PROJECT_DIR, "hackernews.duckdb")},
-    ),
-    "pyspark": configured_pyspark,
-    "hn_client": HNAPIClient(),
-    "dbt": dbt_local_resource,
+_RESOURCE_BUILDERS_BY_NAME = {
+    "RESOURCES_PROD": _resources_prod,
+    "RESOURCES_STAGING": _resources_staging,
+    "RESOURCES_LOCAL": _resources_local,
 }
+_resources_by_name = {}
+
+
+def __getattr__(name):
+    # Each deployment's resources are only constructed the first time they are accessed, so a
+    # code location loading the local resources doesn't also build the prod and staging ones.
+    builder = _RESOURCE_BUILDERS_BY_NAME.get(name)
+    if builder is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    if name not in _resources_by_name:
+        _resources_by_name[name] = builder()
+    return _resources_by_name[name]
@@ -19,8 +19,10 @@ def orders_raw() -> pd.DataFrame:
 DBT_PROJECT_PATH = file_relative_path(__file__, "../../jaffle_shop")
 DBT_PROFILES = file_relative_path(__file__, "../../jaffle_shop/config")
 
-# if larger project use load_assets_from_dbt_manifest
-# dbt_assets = load_assets_from_dbt_manifest(json.load(DBT_PROJECT_PATH + "manifest.json", encoding="utf8"))
+# if larger project use load_assets_from_dbt_manifest, which reads the already-compiled
+# target/manifest.json instead of running dbt to generate it on every load
+# with open(os.path.join(DBT_PROJECT_PATH, "target", "manifest.json"), encoding="utf8") as f:
+#     dbt_assets = load_assets_from_dbt_manifest(json.load(f), key_prefix=["jaffle_shop"])
 dbt_assets = load_assets_from_dbt_project(
     project_dir=DBT_PROJECT_PATH, profiles_dir=DBT_PROFILES, key_prefix=["jaffle_shop"]
 )
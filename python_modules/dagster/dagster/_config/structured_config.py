@@ -1,4 +1,5 @@
 import inspect
+from functools import lru_cache
 
 from dagster._config.config_type import ConfigType
 from dagster._config.source import BoolSource, IntSource, StringSource
@@ -13,7 +14,7 @@ class cached_property:  # type: ignore[no-redef]
 
 
 from abc import ABC, abstractmethod
-from typing import Any, Optional, Type, cast
+from typing import Any, Dict, Optional, Tuple, Type
 
 from pydantic import BaseModel, Extra
 from pydantic.fields import SHAPE_SINGLETON, ModelField
@@ -81,14 +82,13 @@ def _curry_config_schema(schema_field: Field, data: Any) -> IDefinitionConfigSch
     # We don't do anything with this resource definition, other than
     # use it to construct configured schema
     inner_resource_def = ResourceDefinition(lambda _: None, schema_field)
-    configured_resource_def = inner_resource_def.configured(
+    # explicit annotation required to make mypy happy, which does not support Self
+    configured_resource_def: ResourceDefinition = inner_resource_def.configured(
         config_dictionary_from_values(
             data,
             schema_field,
         ),
     )
-    # this cast required to make mypy happy, which does not support Self
-    configured_resource_def = cast(ResourceDefinition, configured_resource_def)
     return configured_resource_def.config_schema
 
 
@@ -216,44 +216,74 @@ def create_io_manager_to_pass_to_user_code(self, context) -> IOManager:
         return self
 
 
+# Fields are immutable and the same field (e.g. a required str with no description) shows up across
+# many Config classes, so share one instance per distinct field rather than re-validating defaults.
+_field_cache: Dict[Tuple[Any, ...], Field] = {}
+
+
 def _convert_pydantic_field(pydantic_field: ModelField) -> Field:
     """
     Transforms a Pydantic field into a corresponding Dagster config field.
     """
     if _safe_is_subclass(pydantic_field.type_, Config):
-        return infer_schema_from_config_class(
-            pydantic_field.type_, description=pydantic_field.field_info.description
+        return _infer_schema_from_config_class_cached(
+            pydantic_field.type_, pydantic_field.field_info.description
         )
 
     if pydantic_field.shape != SHAPE_SINGLETON:
         raise NotImplementedError(f"Pydantic shape {pydantic_field.shape} not supported")
 
-    return Field(
-        config=_config_type_for_pydantic_field(pydantic_field),
-        description=pydantic_field.field_info.description,
-        is_required=_is_pydantic_field_required(pydantic_field),
-        default_value=pydantic_field.default
-        if pydantic_field.default
-        else FIELD_NO_DEFAULT_PROVIDED,
-    )
+    config_type = _config_type_for_pydantic_field(pydantic_field)
+    description = pydantic_field.field_info.description
+    is_required = _is_pydantic_field_required(pydantic_field)
+    default_value = pydantic_field.default if pydantic_field.default else FIELD_NO_DEFAULT_PROVIDED
+
+    cache_key: Optional[Tuple[Any, ...]]
+    try:
+        # the type of the default is part of the key so that e.g. True and 1 don't collide
+        cache_key = (config_type, is_required, type(default_value), default_value, description)
+        field = _field_cache.get(cache_key)
+    except TypeError:
+        # unhashable default values are not cached
+        cache_key = None
+        field = None
+
+    if field is None:
+        field = Field(
+            config=config_type,
+            description=description,
+            is_required=is_required,
+            default_value=default_value,
+        )
+        if cache_key is not None:
+            _field_cache[cache_key] = field
+    return field
 
 
 def _config_type_for_pydantic_field(pydantic_field: ModelField) -> ConfigType:
     return _config_type_for_type_on_pydantic_field(pydantic_field.type_)
 
 
+# special case raw python literals to their source equivalents
+_SOURCE_CONFIG_TYPES_BY_PYTHON_TYPE = {str: StringSource, int: IntSource, bool: BoolSource}
+
+
 def _config_type_for_type_on_pydantic_field(potential_dagster_type: Any) -> ConfigType:
-    # special case raw python literals to their source equivalents
-    if potential_dagster_type is str:
-        return StringSource
-    elif potential_dagster_type is int:
-        return IntSource
-    elif potential_dagster_type is bool:
-        return BoolSource
-    else:
+    try:
+        source_config_type = _SOURCE_CONFIG_TYPES_BY_PYTHON_TYPE.get(potential_dagster_type)
+        if source_config_type is not None:
+            return source_config_type
+        return _convert_potential_field_config_type_cached(potential_dagster_type)
+    except TypeError:
+        # unhashable annotations (e.g. dict or list literals) cannot be looked up or cached
         return convert_potential_field(potential_dagster_type).config_type
 
 
+@lru_cache(maxsize=None)
+def _convert_potential_field_config_type_cached(potential_dagster_type: Any) -> ConfigType:
+    return convert_potential_field(potential_dagster_type).config_type
+
+
 def _is_pydantic_field_required(pydantic_field: ModelField) -> bool:
     # required is of type BoolUndefined = Union[bool, UndefinedType] in Pydantic
     if isinstance(pydantic_field.required, bool):
@@ -328,7 +358,15 @@ def infer_schema_from_config_class(
         issubclass(model_cls, Config),
         "Config type annotation must inherit from dagster._config.structured_config.Config",
     )
+    return _infer_schema_from_config_class_cached(model_cls, description)
 
+
+# Config classes are immutable once defined, so the inferred schema only needs to be built once
+# per (class, description) pair rather than on every resource or op construction.
+@lru_cache(maxsize=None)
+def _infer_schema_from_config_class_cached(
+    model_cls: Type[Config], description: Optional[str]
+) -> Field:
     fields = {}
     for pydantic_field in model_cls.__fields__.values():
         fields[pydantic_field.alias] = _convert_pydantic_field(pydantic_field)
@@ -48,14 +48,14 @@ def _get_function_params(self) -> Sequence[Parameter]:
         return get_function_params(self.decorated_fn)
 
     def has_config_arg(self) -> bool:
-        for param in get_function_params(self.decorated_fn):
+        for param in self._get_function_params():
             if param.name == "config":
                 return True
 
         return False
 
     def get_config_arg(self) -> Parameter:
-        for param in get_function_params(self.decorated_fn):
+        for param in self._get_function_params():
             if param.name == "config":
                 return param
 
@@ -1477,7 +1477,7 @@ def get_runs(
         cursor: Optional[str] = None,
         limit: Optional[int] = None,
         bucket_by: Optional[Union[JobBucket, TagBucket]] = None,
-    ) -> Iterable[DagsterRun]:
+    ) -> Sequence[DagsterRun]:
         return self._run_storage.get_runs(filters, cursor, limit, bucket_by)
 
     @traced
@@ -1640,7 +1640,7 @@ def get_event_records(
     @traced
     def get_asset_records(
         self, asset_keys: Optional[Sequence[AssetKey]] = None
-    ) -> Iterable["AssetRecord"]:
+    ) -> Sequence["AssetRecord"]:
         return self._event_storage.get_asset_records(asset_keys)
 
     @traced
@@ -1,17 +1,50 @@
+import importlib
+from typing import TYPE_CHECKING, Any, Mapping, Sequence
+
+from typing_extensions import Final
+
 from .base import (
     AssetRecord as AssetRecord,
     EventLogRecord as EventLogRecord,
     EventLogStorage as EventLogStorage,
 )
-from .in_memory import InMemoryEventLogStorage as InMemoryEventLogStorage
-from .polling_event_watcher import SqlPollingEventWatcher as SqlPollingEventWatcher
-from .schema import (
-    AssetKeyTable as AssetKeyTable,
-    SqlEventLogStorageMetadata as SqlEventLogStorageMetadata,
-    SqlEventLogStorageTable as SqlEventLogStorageTable,
-)
-from .sql_event_log import SqlEventLogStorage as SqlEventLogStorage
-from .sqlite import (
-    ConsolidatedSqliteEventLogStorage as ConsolidatedSqliteEventLogStorage,
-    SqliteEventLogStorage as SqliteEventLogStorage,
-)
+
+if TYPE_CHECKING:
+    from .in_memory import InMemoryEventLogStorage as InMemoryEventLogStorage
+    from .polling_event_watcher import SqlPollingEventWatcher as SqlPollingEventWatcher
+    from .schema import (
+        AssetKeyTable as AssetKeyTable,
+        SqlEventLogStorageMetadata as SqlEventLogStorageMetadata,
+        SqlEventLogStorageTable as SqlEventLogStorageTable,
+    )
+    from .sql_event_log import SqlEventLogStorage as SqlEventLogStorage
+    from .sqlite import (
+        ConsolidatedSqliteEventLogStorage as ConsolidatedSqliteEventLogStorage,
+        SqliteEventLogStorage as SqliteEventLogStorage,
+    )
+
+# The storage implementations pull in SQLAlchemy table metadata, alembic, and the sqlite/watchdog
+# machinery, so they are only imported the first time one of them is accessed rather than whenever
+# anything (e.g. EventLogRecord) is imported from this package.
+_LAZY_IMPORTS: Final[Mapping[str, str]] = {
+    "InMemoryEventLogStorage": ".in_memory",
+    "SqlPollingEventWatcher": ".polling_event_watcher",
+    "AssetKeyTable": ".schema",
+    "SqlEventLogStorageMetadata": ".schema",
+    "SqlEventLogStorageTable": ".schema",
+    "SqlEventLogStorage": ".sql_event_log",
+    "ConsolidatedSqliteEventLogStorage": ".sqlite",
+    "SqliteEventLogStorage": ".sqlite",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError("module '{}' has no attribute '{}'".format(__name__, name))
+
+
+def __dir__() -> Sequence[str]:
+    return sorted({*globals(), *_LAZY_IMPORTS})
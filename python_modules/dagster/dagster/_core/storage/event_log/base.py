@@ -287,7 +287,7 @@ def can_cache_asset_status_data(self) -> bool:
     @abstractmethod
     def get_asset_records(
         self, asset_keys: Optional[Sequence[AssetKey]] = None
-    ) -> Iterable[AssetRecord]:
+    ) -> Sequence[AssetRecord]:
         pass
 
     @abstractmethod
@@ -295,7 +295,7 @@ def has_asset_key(self, asset_key: AssetKey) -> bool:
         pass
 
     @abstractmethod
-    def all_asset_keys(self) -> Iterable[AssetKey]:
+    def all_asset_keys(self) -> Sequence[AssetKey]:
         pass
 
     @abstractmethod
@@ -309,7 +309,7 @@ def get_asset_keys(
         prefix: Optional[Sequence[str]] = None,
         limit: Optional[int] = None,
         cursor: Optional[str] = None,
-    ) -> Iterable[AssetKey]:
+    ) -> Sequence[AssetKey]:
         # base implementation of get_asset_keys, using the existing `all_asset_keys` and doing the
         # filtering in-memory
         asset_keys = sorted(self.all_asset_keys(), key=str)
@@ -354,7 +354,7 @@ def get_event_tags_for_asset(
         pass
 
     @abstractmethod
-    def get_asset_run_ids(self, asset_key: AssetKey) -> Iterable[str]:
+    def get_asset_run_ids(self, asset_key: AssetKey) -> Sequence[str]:
         pass
 
     @abstractmethod
@@ -1094,7 +1094,7 @@ def can_cache_asset_status_data(self) -> bool:
 
     def get_asset_records(
         self, asset_keys: Optional[Sequence[AssetKey]] = None
-    ) -> Iterable[AssetRecord]:
+    ) -> Sequence[AssetRecord]:
         rows = self._fetch_asset_rows(asset_keys=asset_keys)
         latest_materialization_records = self._get_latest_materialization_records(rows)
         can_cache_asset_status_data = self.can_cache_asset_status_data()
@@ -1118,7 +1118,7 @@ def has_asset_key(self, asset_key: AssetKey) -> bool:
         rows = self._fetch_asset_rows(asset_keys=[asset_key])
         return bool(rows)
 
-    def all_asset_keys(self):
+    def all_asset_keys(self) -> Sequence[AssetKey]:
         rows = self._fetch_asset_rows()
         asset_keys = [AssetKey.from_db_string(row[1]) for row in sorted(rows, key=lambda x: x[1])]
         return [asset_key for asset_key in asset_keys if asset_key]
@@ -1128,7 +1128,7 @@ def get_asset_keys(
         prefix: Optional[Sequence[str]] = None,
         limit: Optional[int] = None,
         cursor: Optional[str] = None,
-    ) -> Iterable[AssetKey]:
+    ) -> Sequence[AssetKey]:
         rows = self._fetch_asset_rows(prefix=prefix, limit=limit, cursor=cursor)
         asset_keys = [AssetKey.from_db_string(row[1]) for row in sorted(rows, key=lambda x: x[1])]
         return [asset_key for asset_key in asset_keys if asset_key]
@@ -1512,7 +1512,7 @@ def get_tag_filter_query(tag_key, tag_value):
 
         return list(tags_by_event_id.values())
 
-    def get_asset_run_ids(self, asset_key):
+    def get_asset_run_ids(self, asset_key: AssetKey) -> Sequence[str]:
         check.inst_param(asset_key, "asset_key", AssetKey)
         query = (
             db.select(
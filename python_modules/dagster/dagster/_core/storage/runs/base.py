@@ -65,7 +65,7 @@ def get_runs(
         cursor: Optional[str] = None,
         limit: Optional[int] = None,
         bucket_by: Optional[Union[JobBucket, TagBucket]] = None,
-    ) -> Iterable[DagsterRun]:
+    ) -> Sequence[DagsterRun]:
         """Return all the runs present in the storage that match the given filters.
 
         Args:
@@ -103,7 +103,7 @@ def execute_monitoring_iteration(
     )
 
     # TODO: consider limiting number of runs to fetch
-    runs = list(instance.get_runs(filters=RunsFilter(statuses=IN_PROGRESS_RUN_STATUSES)))
+    runs = instance.get_runs(filters=RunsFilter(statuses=IN_PROGRESS_RUN_STATUSES))
 
     if not runs:
         return
@@ -4,7 +4,7 @@
 
 import dagster._check as check
 from dagster._utils import convert_dagster_submodule_name
-from dagster._utils.yaml_utils import load_run_config_yaml
+from dagster._utils.yaml_utils import load_generated_yaml
 
 from .serdes import DefaultNamedTupleSerializer, WhitelistMap, whitelist_for_serdes
 
@@ -55,7 +55,7 @@ def __new__(cls, module_name: str, class_name: str, config_yaml: str):
 
     @property
     def config_dict(self) -> Mapping[str, Any]:
-        return check.is_dict(load_run_config_yaml(self.config_yaml), key_type=str)
+        return check.is_dict(load_generated_yaml(self.config_yaml), key_type=str)
 
     def info_dict(self) -> Mapping[str, Any]:
         return {
@@ -186,14 +186,8 @@ def safe_isfile(path: str) -> bool:
 
 
 def mkdir_p(path: str) -> str:
-    try:
-        os.makedirs(path)
-        return path
-    except OSError as exc:  # Python >2.5
-        if exc.errno == errno.EEXIST and os.path.isdir(path):
-            return path
-        else:
-            raise
+    os.makedirs(path, exist_ok=True)
+    return path
 
 
 # TODO: Make frozendict generic for type annotations
@@ -570,3 +570,36 @@ def a_job():
     # use the alias in config space
     assert a_job.execute_in_process({"ops": {"an_op": {"config": {"schema": "bar"}}}}).success
     assert executed["yes"]
+
+
+def test_infer_schema_from_config_class_cached():
+    class NestedConfig(Config):
+        a_string: str
+
+    class ConfigWithNested(Config):
+        nested: NestedConfig
+        an_int: int
+
+    schema = infer_schema_from_config_class(ConfigWithNested)
+    assert infer_schema_from_config_class(ConfigWithNested) is schema
+    assert infer_schema_from_config_class(ConfigWithNested, description="foo") is not schema
+    assert infer_schema_from_config_class(ConfigWithNested, description="foo").description == "foo"
+    assert type_string_from_pydantic(ConfigWithNested) == type_string_from_config_schema(
+        {"nested": {"a_string": StringSource}, "an_int": IntSource}
+    )
+
+
+def test_identical_fields_shared_across_config_classes():
+    class AConfig(Config):
+        a_string: str
+        an_int: int = 5
+
+    class AnotherConfig(Config):
+        a_string: str
+        an_int: int = 6
+
+    a_fields = infer_schema_from_config_class(AConfig).config_type.fields
+    another_fields = infer_schema_from_config_class(AnotherConfig).config_type.fields
+    assert a_fields["a_string"] is another_fields["a_string"]
+    assert a_fields["an_int"] is not another_fields["an_int"]
+    assert another_fields["an_int"].default_value == 6
@@ -2,6 +2,7 @@
 from dagster import job, op
 from dagster._config.config_type import ConfigTypeKind
 from dagster._config.structured_config import Config, PermissiveConfig
+from dagster._core.definitions.decorators.solid_decorator import DecoratedOpFunction
 from dagster._core.errors import DagsterInvalidConfigError
 from dagster._utils.cached_method import cached_method
 
@@ -51,8 +52,6 @@ def a_struct_config_op(config: AnOpConfig):
         # Can pull out config dict to access permissive fields
         assert config.dict() == {"a_string": "foo", "an_int": 2, "a_bool": True}
 
-    from dagster._core.definitions.decorators.solid_decorator import DecoratedOpFunction
-
     assert DecoratedOpFunction(a_struct_config_op).has_config_arg()
 
     # test fields are inferred correctly
@@ -7,6 +7,7 @@
 from dagster._utils import file_relative_path
 from dagster._utils.yaml_utils import (
     dump_run_config_yaml,
+    load_generated_yaml,
     load_run_config_yaml,
     load_yaml_from_glob_list,
     load_yaml_from_globs,
@@ -146,3 +147,4 @@ def test_load_datetime_string():
     assert load_run_config_yaml(date_config_yaml) == {
         "ops": {"my_op": {"config": {"start": "2022-06-10T00:00:00.000000+00:00"}}}
     }
+    assert load_generated_yaml(date_config_yaml) == load_run_config_yaml(date_config_yaml)
@@ -1,6 +1,7 @@
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional, Sequence
+from typing import Any, Optional, Sequence, Tuple
 
 import dagster._check as check
 from dagster import AssetKey, AssetMaterialization
@@ -40,7 +41,7 @@ def _get_path(self, context: OutputContext) -> str:
             keys = context.get_asset_identifier()
         else:
             keys = context.get_run_scoped_output_identifier()
-        return str(Path(self.base_dir, *keys).with_suffix(".ipynb"))
+        return _output_notebook_path(self.base_dir, tuple(keys))
 
     def handle_output(self, context: OutputContext, obj: bytes):
         """obj: bytes."""
@@ -78,6 +79,11 @@ def load_input(self, context) -> bytes:
             return file_obj.read()
 
 
+@lru_cache(maxsize=256)
+def _output_notebook_path(base_dir: str, keys: Tuple[str, ...]) -> str:
+    return str(Path(base_dir, *keys).with_suffix(".ipynb"))
+
+
 @io_manager(
     config_schema={
         "asset_key_prefix": Field(str, is_required=False),